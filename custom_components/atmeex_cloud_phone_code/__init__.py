@@ -1,62 +1,214 @@
-from datetime import timedelta
 import logging
 
-from homeassistant.core import HomeAssistant
+import httpx
+
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
+    UpdateFailed,
 )
 
-from atmeexpy.client import AtmeexClient
+from .vendor.atmeexpy.atmeexpy.client import AtmeexClient
+from .vendor.atmeexpy.atmeexpy.device import Device
+from .vendor.atmeexpy.atmeexpy.transport import get_shared_transport
 
-from .const import CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN, DOMAIN, PLATFORMS
+from .const import (
+    CONF_ACCESS_TOKEN,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_REFRESH_TOKEN,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DOMAIN,
+    PLATFORMS,
+    STORAGE_DEVICES,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .scheduler import PollScheduler
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup(hass: HomeAssistant, config: dict):
     hass.data[DOMAIN] = {}
+    async_setup_services(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
-    api = AtmeexClient(entry.data[CONF_EMAIL], entry.data[CONF_PASSWORD])
-    api.restore_tokens(entry.data[CONF_ACCESS_TOKEN], entry.data[CONF_REFRESH_TOKEN])
+    # All entries share one connection pool; building it loads certificates, so not in the event loop
+    transport = await hass.async_add_executor_job(get_shared_transport)
+    api = AtmeexClient(entry.data[CONF_EMAIL], entry.data[CONF_PASSWORD], transport=transport)
 
-    coordinator = AtmeexDataCoordinator(hass, api, entry)
+    # Tokens rotate after the entry is created, the store has the latest ones
+    store = _async_get_store(hass, entry)
+    cached = await store.async_load() or {}
+    api.restore_tokens(cached.get(CONF_ACCESS_TOKEN, entry.data[CONF_ACCESS_TOKEN]),
+                       cached.get(CONF_REFRESH_TOKEN, entry.data[CONF_REFRESH_TOKEN]))
+
+    coordinator = AtmeexDataCoordinator(hass, api, entry, store)
     hass.data[DOMAIN][entry.entry_id] = coordinator
-    await coordinator.async_refresh()
 
-    for platform in PLATFORMS:
-        hass.async_create_task(
-            hass.config_entries.async_forward_entry_setup(
-                entry, platform
-            )
-        )
+    # With a cached device list entities are created right away and the cloud is
+    # asked in the background; only the very first setup has to wait for it
+    restored = coordinator.restore_devices(cached.get(STORAGE_DEVICES, []))
+    if not restored:
+        await coordinator.async_refresh()
+
+    entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    if restored:
+        # Owned by the entry, so it is cancelled if the entry unloads first
+        entry.async_create_background_task(hass, coordinator.async_refresh(), f"{DOMAIN} first refresh")
     return True
 
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+
+    coordinator: AtmeexDataCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+    await coordinator.async_save_now()
+    await coordinator.api.aclose()
+    return True
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    await _async_get_store(hass, entry).async_remove()
+
+def _async_get_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry):
+    """Apply changed poll limits without reloading the entry."""
+    coordinator: AtmeexDataCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.scheduler.configure(
+        entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+        entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+    )
+    coordinator.update_interval = coordinator.scheduler.update_interval
+    # Re-arm the pending poll now instead of waiting out the old interval
+    coordinator._schedule_refresh()
+
 class AtmeexDataCoordinator(DataUpdateCoordinator):
 
-    def __init__(self, hass: HomeAssistant, api: AtmeexClient, entry: ConfigEntry):
+    def __init__(self, hass: HomeAssistant, api: AtmeexClient, entry: ConfigEntry, store: Store):
+        self.scheduler = PollScheduler(
+            entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+            entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+        )
+
         super().__init__(
             hass,
             _LOGGER,
             name="Atmeex Coordinator",
-            update_interval=timedelta(seconds=60),
+            update_interval=self.scheduler.update_interval,
         )
 
         self.hass = hass
         self.api = api
         self.devices = []
+        self.devices_by_id: dict[int, Device] = {}
+        # entity_id -> Atmeex device id, filled by entities as they are added
+        self.entity_device_ids: dict[str, int] = {}
+        # Devices whose state changed (or which disappeared) in the last update
+        self.changed_ids: set[int] = set()
         self.entry: ConfigEntry = entry
 
+        self.store = store
+        self._saved_tokens = (api.auth._access_token, api.auth._refresh_token)
+        self._save_scheduled = False
+
+    def restore_devices(self, devices_list: list) -> bool:
+        """Fill the device list from the persistent cache without asking the cloud."""
+        self.devices = self.api.restore_devices(devices_list)
+        self._index_devices()
+        return len(self.devices) > 0
+
+    @callback
+    def async_device_updated(self, device: Device):
+        """Store device state returned by a write and notify entities.
+
+        The PUT response already carries the full device model, so there
+        is no refetch right after a command. The scheduler only moves the
+        next poll of the whole account up to one short follow-up poll, for
+        readings that change once the device acts on the command.
+        """
+        self.async_devices_updated([device])
+
+    @callback
+    def async_devices_updated(self, devices: list[Device]):
+        """Same as async_device_updated for a batch of write responses."""
+        for device in devices:
+            device_id = device.model.id
+            if self.devices_by_id.get(device_id) is not device:
+                self.devices = [known for known in self.devices if known.model.id != device_id] + [device]
+                self.devices_by_id[device_id] = device
+        self.changed_ids = {device.model.id for device in devices}
+
+        self.update_interval = self.scheduler.command_sent()
+        self.async_set_updated_data(self.devices)
+        self._async_schedule_save()
+
     async def _async_update_data(self):
-        self.devices = await self.api.get_devices()
+        self.scheduler.poll_started()
+        try:
+            self.devices = await self.api.get_devices()
+            self._index_devices()
+        except httpx.HTTPStatusError as exc:
+            self.update_interval = self.scheduler.poll_failed(_retry_after(exc.response))
+            self.changed_ids = set()
+            raise UpdateFailed(f"Atmeex API responded with {exc.response.status_code}") from exc
+        except httpx.HTTPError as exc:
+            self.update_interval = self.scheduler.poll_failed()
+            self.changed_ids = set()
+            raise UpdateFailed(f"Error communicating with Atmeex API: {exc}") from exc
+        finally:
+            # Tokens may have been refreshed even if the poll itself failed
+            self._async_schedule_save()
+
+        self.update_interval = self.scheduler.poll_succeeded(self.devices)
+        _LOGGER.debug("Next poll in %s (requests: %d, skipped: %d, errors: %d)", self.update_interval,
+                      self.scheduler.requests, self.scheduler.skipped, self.scheduler.errors)
+
+        return self.devices
+
+    @callback
+    def _async_schedule_save(self):
+        """Persist rotated tokens at once and the device list at most every STORAGE_SAVE_DELAY."""
+        tokens = (self.api.auth._access_token, self.api.auth._refresh_token)
+        if tokens != self._saved_tokens:
+            self._saved_tokens = tokens
+            # Refresh tokens are single use, losing the new one means a full login
+            self.hass.async_create_task(self.store.async_save(self._data_to_store()))
+        elif self.changed_ids and not self._save_scheduled:
+            self._save_scheduled = True
+            self.store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+    async def async_save_now(self):
+        """Write a pending device list save before the entry goes away."""
+        if self._save_scheduled:
+            await self.store.async_save(self._data_to_store())
 
-        if self.entry.data[CONF_ACCESS_TOKEN] != self.api.auth._access_token or \
-            self.entry.data[CONF_REFRESH_TOKEN] != self.api.auth._refresh_token:
+    def _data_to_store(self) -> dict:
+        self._save_scheduled = False
+        return {
+            CONF_ACCESS_TOKEN: self.api.auth._access_token,
+            CONF_REFRESH_TOKEN: self.api.auth._refresh_token,
+            STORAGE_DEVICES: [device.model.dict() for device in self.devices],
+        }
 
-            data = self.entry.data
-            data[CONF_ACCESS_TOKEN] = self.api.auth._access_token
-            data[CONF_REFRESH_TOKEN] = self.api.auth._refresh_token
+    def _index_devices(self):
+        devices_by_id = {device.model.id: device for device in self.devices}
+        self.changed_ids = {device_id for device_id, device in devices_by_id.items() if device.changed}
+        self.changed_ids.update(self.devices_by_id.keys() - devices_by_id.keys())
+        self.devices_by_id = devices_by_id
 
-            await self.hass.config_entries.async_update_entry(self.entry, data=data)
+def _retry_after(response: httpx.Response):
+    try:
+        return float(response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
@@ -4,13 +4,13 @@ from homeassistant.components.climate import ClimateEntity, HVACMode, ClimateEnt
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PRECISION_WHOLE, UnitOfTemperature, ATTR_TEMPERATURE
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from atmeexpy.device import Device
+from .vendor.atmeexpy.atmeexpy.device import Device
 
 from . import AtmeexDataCoordinator
 
 from .const import DOMAIN
+from .entity import AtmeexEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,7 +19,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
 
     async_add_entities([AtmeexClimateEntity(device, coordinator) for device in coordinator.devices])
 
-class AtmeexClimateEntity(CoordinatorEntity, ClimateEntity):
+class AtmeexClimateEntity(AtmeexEntity, ClimateEntity):
 
     _attr_hvac_modes = [HVACMode.HEAT, HVACMode.FAN_ONLY, HVACMode.OFF]
     _attr_min_temp = 10
@@ -34,13 +34,9 @@ class AtmeexClimateEntity(CoordinatorEntity, ClimateEntity):
 
 
     def __init__(self, device: Device, coordinator: AtmeexDataCoordinator):
-        CoordinatorEntity.__init__(self, coordinator=coordinator)
-
-        self.coordinator = coordinator
-        self.device = device
-
         self._last_mode = None
-        self._update_state()
+        self._attr_unique_id = f"{device.model.mac}_climate"
+        AtmeexEntity.__init__(self, device, coordinator)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode):
         """Set hvac mode."""
@@ -49,36 +45,38 @@ class AtmeexClimateEntity(CoordinatorEntity, ClimateEntity):
             # Do nothing if mode is same
             _LOGGER.debug(f"{self.name} is asked for mode {hvac_mode}, but it is already in {self.hvac_mode}. Do "
                           f"nothing.")
-            pass
+            return
         elif hvac_mode == HVACMode.OFF:
             self._last_mode = self.hvac_mode
-            await self.device.set_power(False)
+            writes = [self.device.set_power(False)]
         elif hvac_mode == HVACMode.HEAT:
             saved_target_temp = self.target_temperature
 
+            # Device merges concurrent changes into one request
+            writes = [self.device.set_heat_temp(saved_target_temp)]
             if self.hvac_mode == HVACMode.OFF:
-                await self.device.set_power(True)
-
-            await self.device.set_heat_temp(saved_target_temp)
+                writes.insert(0, self.device.set_power(True))
         elif hvac_mode == HVACMode.FAN_ONLY:
+            writes = [self.device.set_heat_temp(-1000)]
             if self.hvac_mode == HVACMode.OFF:
-                await self.device.set_power(True)
-
-            await self.device.set_heat_temp(-1000)
+                writes.insert(0, self.device.set_power(True))
         else:
             _LOGGER.error("Unrecognized hvac mode: %s", hvac_mode)
             return
 
-        await self.coordinator.async_request_refresh()
+        self._attr_hvac_mode = hvac_mode
+        await self._async_write_device(*writes)
 
     async def async_set_fan_mode(self, fan_mode: str):
-        await self.device.set_fan_speed(int(fan_mode)-1)
+        self._attr_fan_mode = fan_mode
+        await self._async_write_device(self.device.set_fan_speed(int(fan_mode)-1))
 
     async def async_set_temperature(self, **kwargs):
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
-        await self.device.set_heat_temp(temperature)
+        self._attr_target_temperature = temperature
+        await self._async_write_device(self.device.set_heat_temp(temperature))
 
     async def async_turn_on(self):
         if self.hvac_mode != HVACMode.OFF:
@@ -93,17 +91,8 @@ class AtmeexClimateEntity(CoordinatorEntity, ClimateEntity):
         _LOGGER.debug(f"Turning off from {self.hvac_mode}")
         await self.async_set_hvac_mode(HVACMode.OFF)
 
-    def _handle_coordinator_update(self) -> None:
-        device_id = self.device.model.id
-        same_devices = [d for d in self.coordinator.devices if d.model.id == device_id]
-
-        if len(same_devices) == 0:
-            self._attr_available = False
-        else:
-            self.device = same_devices[0]
-            self._update_state()
-
-        self.async_write_ha_state()
+    def _state_key(self):
+        return self.available, self._attr_hvac_mode, self._attr_fan_mode, self._attr_target_temperature
 
     def _update_state(self):
         self._attr_fan_mode = str(self.device.model.settings.u_fan_speed+1)
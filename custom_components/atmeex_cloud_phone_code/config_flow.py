@@ -1,11 +1,21 @@
 import logging
 
 import voluptuous as vol
-from atmeexpy.client import AtmeexClient
+from .vendor.atmeexpy.atmeexpy.client import AtmeexClient
+from .vendor.atmeexpy.atmeexpy.transport import get_shared_transport
 
-from homeassistant.config_entries import ConfigFlow
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_PASSWORD, CONF_EMAIL
-from .const import DOMAIN, CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN
+from homeassistant.core import callback
+from .const import (
+    DOMAIN,
+    CONF_ACCESS_TOKEN,
+    CONF_REFRESH_TOKEN,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,6 +31,11 @@ class ConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry):
+        return AtmeexOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
         if user_input is None:
@@ -30,8 +45,10 @@ class ConfigFlow(ConfigFlow, domain=DOMAIN):
 
         errors = {}
 
+        transport = await self.hass.async_add_executor_job(get_shared_transport)
+        atmeex = AtmeexClient(user_input.get(CONF_EMAIL), user_input.get(CONF_PASSWORD), transport=transport)
+
         try:
-            atmeex = AtmeexClient(user_input.get(CONF_EMAIL), user_input.get(CONF_PASSWORD))
             devices = await atmeex.get_devices()
             if len(devices) == 0:
                 errors["base"] = "no devices found in account"
@@ -45,7 +62,39 @@ class ConfigFlow(ConfigFlow, domain=DOMAIN):
         except Exception as exc:
             _LOGGER.exception("Unexpected exception")
             errors["base"] = str(exc)
+        finally:
+            await atmeex.aclose()
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
+
+class AtmeexOptionsFlow(OptionsFlow):
+    """Poll interval limits for the adaptive scheduler."""
+
+    def __init__(self, config_entry: ConfigEntry):
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        errors = {}
+
+        if user_input is not None:
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors["base"] = "min scan interval is greater than max scan interval"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_MIN_SCAN_INTERVAL,
+                    default=options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+                ): vol.All(int, vol.Range(min=5)),
+                vol.Required(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+                ): vol.All(int, vol.Range(min=5)),
+            },
+        )
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
@@ -1,7 +1,36 @@
 DOMAIN = "atmeex_cloud_phone_code"
 CONF_ACCESS_TOKEN = "access_token"
 CONF_REFRESH_TOKEN = "refresh_token"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
 PLATFORMS = [
     "climate",
     "fan",
-]
\ No newline at end of file
+    "sensor",
+]
+
+# u_damp_pos values as fan preset modes
+DAMPER_PRESETS = ["open", "mixed", "closed"]
+
+SERVICE_SET_PARAMS = "set_params"
+ATTR_POWER = "power"
+ATTR_FAN_SPEED = "fan_speed"
+ATTR_DAMPER = "damper"
+
+# Poll intervals, seconds
+DEFAULT_SCAN_INTERVAL = 60
+DEFAULT_MIN_SCAN_INTERVAL = 10
+DEFAULT_MAX_SCAN_INTERVAL = 600
+# The write response already has the new settings; one follow-up poll this long
+# after the last command picks up what the device measured in response
+COMMAND_FOLLOWUP_SECONDS = 30
+# Reading changes smaller than this are sensor noise and don't speed up polling
+CO2_DEADBAND_PPM = 50
+# temp_room is in tenths of a degree
+TEMP_DEADBAND = 5
+
+# Persistent cache of tokens and the last device list
+STORAGE_VERSION = 1
+STORAGE_DEVICES = "devices"
+# Device list writes are batched, tokens are written as soon as they change
+STORAGE_SAVE_DELAY = 600
\ No newline at end of file
@@ -0,0 +1,31 @@
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from . import AtmeexDataCoordinator
+
+from .const import CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN, DOMAIN
+
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN, "mac", "socket_id"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Poll statistics and the last device list of one account."""
+    coordinator: AtmeexDataCoordinator = hass.data[DOMAIN][entry.entry_id]
+    scheduler = coordinator.scheduler
+
+    return {
+        "entry": async_redact_data({"data": dict(entry.data), "options": dict(entry.options)}, TO_REDACT),
+        "poll": {
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "min_interval": scheduler.min_interval,
+            "max_interval": scheduler.max_interval,
+            "base_interval": scheduler.base_interval,
+            "requests": scheduler.requests,
+            "skipped": scheduler.skipped,
+            "errors": scheduler.errors,
+            "last_update_success": coordinator.last_update_success,
+        },
+        "devices": [async_redact_data(device.model.dict(), TO_REDACT) for device in coordinator.devices],
+    }
@@ -0,0 +1,93 @@
+import asyncio
+
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .vendor.atmeexpy.atmeexpy.device import Device
+
+from . import AtmeexDataCoordinator
+
+from .const import DOMAIN
+
+
+class AtmeexEntity(CoordinatorEntity):
+    """Base for entities built on one device from the shared /devices poll.
+
+    Subclasses fill their _attr_* in _update_state() and list what they
+    publish in _state_key(); state is written only when that key changes.
+    """
+
+    def __init__(self, device: Device, coordinator: AtmeexDataCoordinator):
+        CoordinatorEntity.__init__(self, coordinator=coordinator)
+
+        self.coordinator = coordinator
+        self.device = device
+
+        # Lets entities be targeted by device and area in services
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.model.mac)},
+            name=device.model.name,
+            manufacturer="Atmeex",
+            model=device.model.model,
+            sw_version=device.model.fw_ver,
+        )
+
+        self._update_state()
+        self._written_state = self._state_key()
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.coordinator.entity_device_ids[self.entity_id] = self.device.model.id
+
+    async def async_will_remove_from_hass(self) -> None:
+        self.coordinator.entity_device_ids.pop(self.entity_id, None)
+        await super().async_will_remove_from_hass()
+
+    @property
+    def available(self) -> bool:
+        return super().available and self._attr_available
+
+    def _handle_coordinator_update(self) -> None:
+        device_id = self.device.model.id
+        if device_id in self.coordinator.changed_ids:
+            device = self.coordinator.devices_by_id.get(device_id)
+            if device is None:
+                self._attr_available = False
+            else:
+                self.device = device
+                self._attr_available = True
+                self._update_state()
+
+        # Availability also follows coordinator failures, so check even if the device is unchanged
+        self._async_write_state_if_changed()
+
+    async def _async_write_device(self, *writes):
+        """Show the requested state at once, then apply the device response."""
+        self._async_write_state_if_changed()
+
+        try:
+            await asyncio.gather(*writes)
+        except Exception:
+            # The model is untouched by a failed write, so drop the optimistic
+            # state right away, then fetch in case the device did change
+            self._update_state()
+            self._async_write_state_if_changed()
+            await self.coordinator.async_request_refresh()
+            raise
+
+        # The device may have answered with something other than what was asked
+        self._update_state()
+        self._async_write_state_if_changed()
+        self.coordinator.async_device_updated(self.device)
+
+    def _state_key(self) -> tuple:
+        raise NotImplementedError
+
+    def _update_state(self):
+        raise NotImplementedError
+
+    def _async_write_state_if_changed(self):
+        state = self._state_key()
+        if state != self._written_state:
+            self._written_state = state
+            self.async_write_ha_state()
@@ -1,6 +1,90 @@
+import math
+
+from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util.percentage import percentage_to_ranged_value, ranged_value_to_percentage
+
+from .vendor.atmeexpy.atmeexpy.device import Device
+
+from . import AtmeexDataCoordinator
+
+from .const import DAMPER_PRESETS, DOMAIN
+from .entity import AtmeexEntity
+
+# u_fan_speed 0..6 shifted to 1..7 so that 0% means off
+SPEED_RANGE = (1, 7)
+
+async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities):
+    coordinator: AtmeexDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    async_add_entities([AtmeexFanEntity(device, coordinator) for device in coordinator.devices])
+
+class AtmeexFanEntity(AtmeexEntity, FanEntity):
+
+    _attr_supported_features = (
+        FanEntityFeature.SET_SPEED
+        | FanEntityFeature.PRESET_MODE
+        | FanEntityFeature.TURN_ON
+        | FanEntityFeature.TURN_OFF
+    )
+    _enable_turn_on_off_backwards_compatibility = False
+    _attr_speed_count = SPEED_RANGE[1] - SPEED_RANGE[0] + 1
+    _attr_preset_modes = DAMPER_PRESETS
+    _attr_icon = 'mdi:fan'
+
+    def __init__(self, device: Device, coordinator: AtmeexDataCoordinator):
+        self._attr_name = f"{device.model.name} fan"
+        self._attr_unique_id = f"{device.model.mac}_fan"
+        AtmeexEntity.__init__(self, device, coordinator)
+
+    async def async_set_percentage(self, percentage: int):
+        if percentage == 0:
+            await self.async_turn_off()
+            return
+
+        fan_speed = math.ceil(percentage_to_ranged_value(SPEED_RANGE, percentage)) - 1
+        writes = [self.device.set_fan_speed(fan_speed)]
+        if not self._attr_is_on:
+            writes.insert(0, self.device.set_power(True))
+
+        self._attr_is_on = True
+        self._attr_percentage = ranged_value_to_percentage(SPEED_RANGE, fan_speed + 1)
+        await self._async_write_device(*writes)
+
+    async def async_set_preset_mode(self, preset_mode: str):
+        self._attr_preset_mode = preset_mode
+        await self._async_write_device(self.device.set_damper(DAMPER_PRESETS.index(preset_mode)))
+
+    async def async_turn_on(self, percentage: int = None, preset_mode: str = None, **kwargs):
+        # Device merges these changes into one request, the last write of a field wins
+        writes = []
+        if not self._attr_is_on:
+            writes.append(self.device.set_power(True))
+            self._attr_is_on = True
+        if percentage:
+            fan_speed = math.ceil(percentage_to_ranged_value(SPEED_RANGE, percentage)) - 1
+            writes.append(self.device.set_fan_speed(fan_speed))
+            self._attr_percentage = ranged_value_to_percentage(SPEED_RANGE, fan_speed + 1)
+        if preset_mode is not None:
+            writes.append(self.device.set_damper(DAMPER_PRESETS.index(preset_mode)))
+            self._attr_preset_mode = preset_mode
+
+        if writes:
+            await self._async_write_device(*writes)
+
+    async def async_turn_off(self, **kwargs):
+        self._attr_is_on = False
+        self._attr_percentage = 0
+        await self._async_write_device(self.device.set_power(False))
 
-from .const import DOMAIN
+    def _state_key(self):
+        return self.available, self._attr_is_on, self._attr_percentage, self._attr_preset_mode
 
-async def async_setup_entry(hass, config_entry: ConfigEntry, async_add_entities):
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
\ No newline at end of file
+    def _update_state(self):
+        settings = self.device.model.settings
+        self._attr_is_on = settings.u_pwr_on
+        self._attr_percentage = ranged_value_to_percentage(SPEED_RANGE, settings.u_fan_speed + 1) \
+            if settings.u_pwr_on else 0
+        self._attr_preset_mode = DAMPER_PRESETS[settings.u_damp_pos] \
+            if 0 <= settings.u_damp_pos < len(DAMPER_PRESETS) else None
@@ -0,0 +1,103 @@
+from datetime import timedelta
+import time
+
+from .vendor.atmeexpy.atmeexpy.device import Device
+
+from .const import (
+    CO2_DEADBAND_PPM,
+    COMMAND_FOLLOWUP_SECONDS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    TEMP_DEADBAND,
+)
+
+
+class PollScheduler:
+    """Pick the next /devices poll interval from what the devices are doing.
+
+    Makes one follow-up poll shortly after a command, polls fast while
+    readings of a running device move past the deadband, polls at the base
+    interval while something is running, and backs off exponentially (up to
+    max_interval) when every device is off or offline or the API keeps
+    failing.
+    """
+
+    def __init__(self, min_interval: int = DEFAULT_MIN_SCAN_INTERVAL,
+                 max_interval: int = DEFAULT_MAX_SCAN_INTERVAL,
+                 base_interval: int = DEFAULT_SCAN_INTERVAL):
+        self.requests = 0
+        self.skipped = 0
+        self.errors = 0
+
+        self._interval = base_interval
+        self._last_poll = None
+        self._last_readings = {}
+        self.configure(min_interval, max_interval, base_interval)
+
+    def configure(self, min_interval: int, max_interval: int, base_interval: int = DEFAULT_SCAN_INTERVAL):
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.base_interval = min(max(base_interval, self.min_interval), self.max_interval)
+        self._interval = min(max(self._interval, self.min_interval), self.max_interval)
+
+    @property
+    def update_interval(self) -> timedelta:
+        return timedelta(seconds=self._interval)
+
+    def command_sent(self) -> timedelta:
+        """Schedule one follow-up poll, unless the next poll is already sooner."""
+        self._interval = min(self._interval, max(COMMAND_FOLLOWUP_SECONDS, self.min_interval))
+        return self.update_interval
+
+    def poll_started(self):
+        now = time.monotonic()
+        if self._last_poll is not None:
+            # Polls the fixed base interval would have made since the last one
+            self.skipped += max(0, int((now - self._last_poll) // self.base_interval) - 1)
+        self._last_poll = now
+        self.requests += 1
+
+    def poll_succeeded(self, devices: list[Device]) -> timedelta:
+        changing = False
+        readings = {}
+        for device in devices:
+            condition = device.model.condition
+            if condition is None:
+                continue
+            reading = (condition.co2_ppm, condition.temp_room)
+            last = self._last_readings.get(device.model.id, reading)
+            if abs(reading[0] - last[0]) >= CO2_DEADBAND_PPM or abs(reading[1] - last[1]) >= TEMP_DEADBAND:
+                # Readings of a device that is off or offline drift on their own
+                changing = changing or _is_running(device)
+            else:
+                # Keep the last reading that counted, so slow drift still adds up past the deadband
+                reading = last
+            readings[device.model.id] = reading
+        self._last_readings = readings
+
+        active = any(_is_running(device) for device in devices)
+
+        if changing:
+            self._interval = self.min_interval
+        elif active:
+            self._interval = self.base_interval
+        else:
+            self._back_off()
+
+        return self.update_interval
+
+    def poll_failed(self, retry_after: float = None) -> timedelta:
+        self.errors += 1
+        self._back_off()
+        if retry_after is not None:
+            self._interval = min(max(self._interval, retry_after), self.max_interval)
+
+        return self.update_interval
+
+    def _back_off(self):
+        self._interval = min(max(self._interval, self.base_interval) * 2, self.max_interval)
+
+
+def _is_running(device: Device) -> bool:
+    return device.model.online is not False and bool(device.model.settings.u_pwr_on)
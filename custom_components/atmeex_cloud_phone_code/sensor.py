@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONCENTRATION_PARTS_PER_MILLION, PERCENTAGE, UnitOfTemperature
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.typing import StateType
+
+from .vendor.atmeexpy.atmeexpy.device import Device
+from .vendor.atmeexpy.atmeexpy.models import DeviceConditionModel
+
+from . import AtmeexDataCoordinator
+
+from .const import DAMPER_PRESETS, DOMAIN
+from .entity import AtmeexEntity
+
+
+@dataclass(frozen=True, kw_only=True)
+class AtmeexSensorEntityDescription(SensorEntityDescription):
+    value_fn: Callable[[DeviceConditionModel], StateType]
+
+
+# Temperatures come from the cloud multiplied by 10
+SENSORS = [
+    AtmeexSensorEntityDescription(
+        key="co2",
+        name="CO2",
+        device_class=SensorDeviceClass.CO2,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+        value_fn=lambda condition: condition.co2_ppm,
+    ),
+    AtmeexSensorEntityDescription(
+        key="temp_in",
+        name="inlet temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=lambda condition: condition.temp_in / 10,
+    ),
+    AtmeexSensorEntityDescription(
+        key="temp_room",
+        name="room temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=lambda condition: condition.temp_room / 10,
+    ),
+    AtmeexSensorEntityDescription(
+        key="hum_room",
+        name="room humidity",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        value_fn=lambda condition: condition.hum_room,
+    ),
+    AtmeexSensorEntityDescription(
+        key="damp_pos",
+        name="damper",
+        device_class=SensorDeviceClass.ENUM,
+        options=DAMPER_PRESETS,
+        icon="mdi:valve",
+        value_fn=lambda condition: DAMPER_PRESETS[condition.damp_pos]
+            if 0 <= condition.damp_pos < len(DAMPER_PRESETS) else None,
+    ),
+    AtmeexSensorEntityDescription(
+        key="fan_speed",
+        name="fan speed",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:fan",
+        value_fn=lambda condition: condition.fan_speed + 1,
+    ),
+]
+
+async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities):
+    coordinator: AtmeexDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    async_add_entities([
+        AtmeexSensorEntity(device, coordinator, description)
+        for device in coordinator.devices
+        for description in SENSORS
+    ])
+
+class AtmeexSensorEntity(AtmeexEntity, SensorEntity):
+    """One reading of DeviceConditionModel, taken from the shared poll."""
+
+    entity_description: AtmeexSensorEntityDescription
+
+    def __init__(self, device: Device, coordinator: AtmeexDataCoordinator,
+                 description: AtmeexSensorEntityDescription):
+        self.entity_description = description
+        self._attr_name = f"{device.model.name} {description.name}"
+        self._attr_unique_id = f"{device.model.mac}_{description.key}"
+        AtmeexEntity.__init__(self, device, coordinator)
+
+    def _state_key(self):
+        return self.available, self._attr_native_value
+
+    def _update_state(self):
+        condition = self.device.model.condition
+        self._attr_native_value = None if condition is None else self.entity_description.value_fn(condition)
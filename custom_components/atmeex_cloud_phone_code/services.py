@@ -0,0 +1,83 @@
+import asyncio
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_TEMPERATURE
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_entity_ids
+
+from .vendor.atmeexpy.atmeexpy.models import DeviceSettingsSetModel
+
+from .const import (
+    ATTR_DAMPER,
+    ATTR_FAN_SPEED,
+    ATTR_POWER,
+    DAMPER_PRESETS,
+    DOMAIN,
+    SERVICE_SET_PARAMS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SET_PARAMS_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional(ATTR_POWER): cv.boolean,
+        vol.Optional(ATTR_FAN_SPEED): vol.All(vol.Coerce(int), vol.Range(min=1, max=7)),
+        vol.Optional(ATTR_DAMPER): vol.In(DAMPER_PRESETS),
+        vol.Optional(ATTR_TEMPERATURE): vol.All(vol.Coerce(float), vol.Range(min=10, max=30)),
+    },
+)
+
+def async_setup_services(hass: HomeAssistant):
+    """Register services that control many devices with one call."""
+
+    async def async_set_params(call: ServiceCall):
+        params = _params_from_call(call)
+        entity_ids = await async_extract_entity_ids(hass, call)
+
+        # Every account sends its whole batch concurrently
+        batches = []
+        for coordinator in hass.data[DOMAIN].values():
+            device_ids = {coordinator.entity_device_ids[entity_id] for entity_id in entity_ids
+                          if entity_id in coordinator.entity_device_ids}
+            if device_ids:
+                batches.append((coordinator, coordinator.api.set_params_many(device_ids, params)))
+        if not batches:
+            raise HomeAssistantError(f"{SERVICE_SET_PARAMS} targets no Atmeex devices")
+
+        failed = []
+        for (coordinator, _), results in zip(batches, await asyncio.gather(*[batch for _, batch in batches])):
+            updated = [
+                coordinator.devices_by_id[device_id] for device_id, result in results.items()
+                if not isinstance(result, Exception) and device_id in coordinator.devices_by_id
+            ]
+            if updated:
+                coordinator.async_devices_updated(updated)
+            for device_id, result in results.items():
+                if isinstance(result, Exception):
+                    _LOGGER.error("Failed to set params of device %s: %s", device_id, result)
+                    failed.append(device_id)
+
+        if failed:
+            raise HomeAssistantError(f"Failed to set params of {len(failed)} device(s): {sorted(failed)}")
+
+    hass.services.async_register(DOMAIN, SERVICE_SET_PARAMS, async_set_params, schema=SET_PARAMS_SCHEMA)
+
+def _params_from_call(call: ServiceCall) -> DeviceSettingsSetModel:
+    params = DeviceSettingsSetModel(u_pwr_on=call.data.get(ATTR_POWER))
+    if ATTR_FAN_SPEED in call.data:
+        params.u_fan_speed = call.data[ATTR_FAN_SPEED] - 1
+    if ATTR_DAMPER in call.data:
+        params.u_damp_pos = DAMPER_PRESETS.index(call.data[ATTR_DAMPER])
+    if ATTR_TEMPERATURE in call.data:
+        # The cloud takes temperature * 10 in 0.5 degree steps
+        params.u_temp_room = round(call.data[ATTR_TEMPERATURE] * 2) * 5
+
+    if params.u_pwr_on is None and params.u_fan_speed is None and params.u_damp_pos is None and \
+            params.u_temp_room is None:
+        raise HomeAssistantError(f"{SERVICE_SET_PARAMS} needs at least one of {ATTR_POWER}, {ATTR_FAN_SPEED}, "
+                                 f"{ATTR_DAMPER}, {ATTR_TEMPERATURE}")
+    return params